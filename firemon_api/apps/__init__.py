@@ -47,30 +47,29 @@ class SecurityManager(App):
 
     name = "securitymanager"
 
-    def __init__(self, api):
-        super().__init__(api)
-
-        # Endpoints
-        self.centralsyslogconfigs = CentralSyslogConfigs(self.api, self)
-        self.centralsyslogs = CentralSyslogs(self.api, self)
-        self.collectionconfigs = CollectionConfigs(self.api, self)
-        self.collectors = Collectors(self.api, self)
-        self.collectorgroups = CollectorGroups(self.api, self)
-        self.deviceclusters = DeviceClusters(self.api, self)
-        self.devicegroups = DeviceGroups(self.api, self)
-        self.devices = Devices(self.api, self)
-        self.dp = DevicePacks(self.api, self)  # Todo: create the other /plugin
-        self.es = ElasticSearch(self.api, self)
-        self.license = License(self.api, self)
-        self.logging = Logging(self.api, self)
-        self.maps = Maps(self.api, self)
-        self.revisions = Revisions(self.api, self)
-        self.users = Users(self.api, self)
-        self.usergroups = UserGroups(self.api, self)
-        self.routes = Routes(self.api, self)
-        self.siql = Siql(self.api, self)
-        self.zones = Zones(self.api, self)
-        self.fmzones = FmZones(self.api, self)
+    # Endpoints: constructed lazily on first access (see App.__getattr__)
+    _endpoints = {
+        "centralsyslogconfigs": CentralSyslogConfigs,
+        "centralsyslogs": CentralSyslogs,
+        "collectionconfigs": CollectionConfigs,
+        "collectors": Collectors,
+        "collectorgroups": CollectorGroups,
+        "deviceclusters": DeviceClusters,
+        "devicegroups": DeviceGroups,
+        "devices": Devices,
+        "dp": DevicePacks,  # Todo: create the other /plugin
+        "es": ElasticSearch,
+        "license": License,
+        "logging": Logging,
+        "maps": Maps,
+        "revisions": Revisions,
+        "users": Users,
+        "usergroups": UserGroups,
+        "routes": Routes,
+        "siql": Siql,
+        "zones": Zones,
+        "fmzones": FmZones,
+    }
 
 
 class Orchestration(App):
@@ -86,11 +85,10 @@ class Orchestration(App):
 
     name = "orchestration"
 
-    def __init__(self, api):
-        super().__init__(api)
-
-        # Endpoints
-        self.changes = OrcChanges(self.api, self)
+    # Endpoints: constructed lazily on first access (see App.__getattr__)
+    _endpoints = {
+        "changes": OrcChanges,
+    }
 
 
 class PolicyOptimizer(App):
@@ -106,11 +104,10 @@ class PolicyOptimizer(App):
 
     name = "policyoptimizer"
 
-    def __init__(self, api):
-        super().__init__(api)
-
-        # Endpoints
-        # self.xx = EndPoint(self.api, self)
+    # Endpoints: constructed lazily on first access (see App.__getattr__)
+    _endpoints = {
+        # "xx": EndPoint,
+    }
 
 
 class PolicyPlanner(App):
@@ -128,13 +125,12 @@ class PolicyPlanner(App):
 
     name = "policyplanner"
 
-    def __init__(self, api):
-        super().__init__(api)
-
-        # Endpoints
-        self.siql = SiqlPP(self.api, self)
-        self.tasks = Tasks(self.api, self)
-        self.workflows = Workflows(self.api, self)
+    # Endpoints: constructed lazily on first access (see App.__getattr__)
+    _endpoints = {
+        "siql": SiqlPP,
+        "tasks": Tasks,
+        "workflows": Workflows,
+    }
 
 
 class ControlPanel(App):
@@ -152,6 +148,15 @@ class ControlPanel(App):
         diagpkg: DiagPkg()
     """
 
+    # Endpoints: constructed lazily on first access (see App.__getattr__)
+    _endpoints = {
+        "ca": CertAuth,
+        "cleanup": Cleanup,
+        "config": Config,
+        "db": Database,
+        "diagpkg": DiagPkg,
+    }
+
     def __init__(self, api):
         super().__init__(api)
         self.domain_url = None
@@ -160,13 +165,6 @@ class ControlPanel(App):
         else:
             self.app_url = f"{api.base_url}:55555/api"
 
-        # Endpoints
-        self.ca = CertAuth(self.api, self)
-        self.cleanup = Cleanup(self.api, self)
-        self.config = Config(self.api, self)
-        self.db = Database(self.api, self)
-        self.diagpkg = DiagPkg(self.api, self)
-
     def set_api(self) -> None:
         """Maybe later"""
         raise NotImplementedError("Maybe some other time")
@@ -3,8 +3,6 @@ import logging
 from typing import Literal, Optional, Union
 
 # Local packages
-from firemon_api.core.app import App
-from firemon_api.core.api import FiremonAPI
 from firemon_api.core.endpoint import Endpoint
 from firemon_api.core.query import Request
 from firemon_api.core.response import BaseRecord
@@ -38,9 +36,7 @@ class OrcChanges(Endpoint):
 
     ep_name = "change/request"
     _is_domain_url = True
-
-    def __init__(self, api: FiremonAPI, app: App, record=OrcChangeRequest):
-        super().__init__(api, app, record=record)
+    return_obj = OrcChangeRequest
 
     def filter(
         self,
@@ -64,7 +60,7 @@ class OrcChanges(Endpoint):
             base=self.url,
             filters=filters,
             key=self._ep["filter"],
-            session=self.api.session,
+            session=self.session,
         )
 
         ret = [self._response_loader(i) for i in req.get()]
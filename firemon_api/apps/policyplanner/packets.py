@@ -1,6 +1,7 @@
 # Standard packages
-import datetime
+import concurrent.futures as cf
 import logging
+import operator
 from typing import Optional
 
 # Local packages
@@ -9,13 +10,18 @@ from firemon_api.core.api import FiremonAPI
 from firemon_api.core.endpoint import Endpoint
 from firemon_api.core.errors import PolicyPlannerError
 from firemon_api.core.response import BaseRecord, Record
-from firemon_api.core.query import Request, RequestResponse
+from firemon_api.core.query import MAX_WORKERS, Request, RequestResponse
 from firemon_api.apps.structure import PolicyPlanRequirement
 from .siql import SiqlPP
 from .policyplan import Changes, Requirements
 
 log = logging.getLogger(__name__)
 
+# Plain-text header set for the assign/unassign calls, mirroring the
+# per-verb constants in core/query.py. Passed per request; never
+# written onto the shared session.
+_HEADERS_TEXT = {"Content-Type": "text/plain"}
+
 
 class PacketTaskError(PolicyPlannerError):
     pass
@@ -33,15 +39,18 @@ class PacketTask(Record):
         self._wf_id = self._config["workflowTask"]["workflowVersion"]["id"]
         self._task_id = self._config["workflowTask"]["id"]
 
-        self._ep_url = (
-            f"{self._domain_url}/workflow/{self._wf_id}/"
-            f"task/{self._task_id}/packet/{self._packet_id}/{self.__class__._ep_name}"
+        # Both urls share the same workflow/task/packet tail. Build it
+        # once instead of re-interpolating (and re-walking the config
+        # for the workflow id).
+        _wf_path = (
+            f"workflow/{self._wf_id}/task/{self._task_id}/packet/{self._packet_id}"
         )
 
+        self._ep_url = f"{self._domain_url}/{_wf_path}/{self._ep_name}"
+
         self._policyplan_url = (
             f"{self._app_url}/policyplan/domain/{self._app._app.api.domain_id}/"
-            f"workflow/{self._config['workflowTask']['workflowVersion']['id']}/"
-            f"task/{self._task_id}/packet/{self._packet_id}"
+            f"{_wf_path}"
         )
         self._url = self._url_create()
 
@@ -79,12 +88,10 @@ class PacketTask(Record):
     def assign(self, id: str) -> RequestResponse:
         """Assign a packet task"""
         key = "assign"
-        headers = self._session.headers
-        headers.update({"Content-Type": "text/plain"})
         req = Request(
             base=self._url,
             key=key,
-            headers=headers,
+            headers=_HEADERS_TEXT,
             session=self._session,
         )
         return req.put(data=str(id))
@@ -92,12 +99,10 @@ class PacketTask(Record):
     def unassign(self) -> RequestResponse:
         """Unassign a packet task"""
         key = "unassign"
-        headers = self._session.headers
-        headers.update({"Content-Type": "text/plain"})
         req = Request(
             base=self._url,
             key=key,
-            headers=headers,
+            headers=_HEADERS_TEXT,
             session=self._session,
         )
         return req.put()
@@ -161,10 +166,10 @@ class PacketTasks(Endpoint):
         self.app_url = app._app_url
         self.domain_url = app._domain_url
         self.url = None
-        if self.__class__._is_domain_url and self.__class__.ep_name:
-            self.url = f"{self.domain_url}/{self.__class__.ep_name}"
-        elif self.__class__.ep_name:
-            self.url = f"{self.app_url}/{self.__class__.ep_name}"
+        if self._is_domain_url and self.ep_name:
+            self.url = f"{self.domain_url}/{self.ep_name}"
+        elif self.ep_name:
+            self.url = f"{self.app_url}/{self.ep_name}"
 
         # These will be used update `key` values for `query.Request`
         # (i.e. they will be appended to 'self.url' to get full path)
@@ -177,17 +182,30 @@ class PacketTasks(Endpoint):
             "count": None,
         }
         self._packet_id = packet_id
+        self._pt_cache = None
+        self._pt_index = {}
+        self._pt_items = []
 
     def _response_loader(self, values, packet_id):
         return self.return_obj(values, self.app, packet_id)
 
     def all(self) -> list[PacketTask]:
-        p_tasks = []
-        for wfpt in sorted(
-            self.app._config["workflowPacketTasks"], key=lambda p: p["id"]
-        ):
-            p_tasks.append(self._response_loader(wfpt, self._packet_id))
-        return p_tasks
+        # The tasks all come from the parent packet config which does
+        # not change under us. Build the records once and re-use for
+        # get()/filter()/last_modified() instead of rebuilding per call.
+        if self._pt_cache is None:
+            p_tasks = []
+            for wfpt in sorted(
+                self.app._config["workflowPacketTasks"],
+                key=operator.itemgetter("id"),
+            ):
+                p_tasks.append(self._response_loader(wfpt, self._packet_id))
+            self._pt_cache = p_tasks
+            # Index by id and pre-cast each task to a dict so get() and
+            # filter() do not re-scan or re-cast per call.
+            self._pt_index = {pt.id: pt for pt in p_tasks}
+            self._pt_items = [(pt, dict(pt)) for pt in p_tasks]
+        return self._pt_cache
 
     def get(self, *args, **kwargs) -> Optional[PacketTask]:
         """Query and retrieve individual PacketTask
@@ -204,13 +222,13 @@ class PacketTasks(Endpoint):
         >>>
         """
 
-        pt_all = self.all()
+        self.all()
         try:
             # Only getting exact matches
             id = args[0]
-            pt_l = [pt for pt in pt_all if pt.id == id]
-            if len(pt_l) == 1:
-                return pt_l[0]
+            pt = self._pt_index.get(id)
+            if pt is not None:
+                return pt
             else:
                 raise PacketTaskError(
                     f"The requested Packet Task: {id} could not be found"
@@ -245,20 +263,17 @@ class PacketTasks(Endpoint):
         >>>
         """
 
-        pt_all = self.all()
+        self.all()
         if not kwargs:
             raise ValueError("filter must have kwargs")
 
-        return [pt for pt in pt_all if kwargs.items() <= dict(pt).items()]
+        return [pt for pt, d in self._pt_items if kwargs.items() <= d.items()]
 
     def last_modified(self) -> PacketTask:
         """Get task by last modified date"""
-        return sorted(
-            self.all(),
-            key=lambda p: datetime.datetime.fromisoformat(
-                p.lastModifiedDate.rstrip("Z")
-            ),
-        )[0]
+        # lastModifiedDate is ISO-8601 so the strings sort the same as
+        # the parsed datetimes. Skip fromisoformat() per task.
+        return min(self.all(), key=lambda p: p.lastModifiedDate)
 
     def get_open(self) -> Optional[PacketTask]:
         """Get the task that is not completed"""
@@ -274,14 +289,16 @@ class Packet(BaseRecord):
 
     _ep_name = "packet"
     _is_domain_url = True
+    # Workflow scoped url layout, fixed at class load
+    _url_template = "{domain_url}/workflow/{wf_id}/{ep_name}"
 
     def __init__(self, config: dict, app: App):
         super().__init__(config, app)
         self._wf_id = self._config["workflowVersion"]["id"]
 
-        if self.__class__._is_domain_url and self.__class__._ep_name:
-            self._ep_url = (
-                f"{self._domain_url}/workflow/{self._wf_id}/{self.__class__._ep_name}"
+        if self._is_domain_url and self._ep_name:
+            self._ep_url = self._url_template.format(
+                domain_url=self._domain_url, wf_id=self._wf_id, ep_name=self._ep_name
             )
         self._url = self._url_create()
 
@@ -310,21 +327,50 @@ class Packets(Endpoint):
 
     ep_name = "packet"
     _is_domain_url = True
+    # Workflow scoped url layout, fixed at class load
+    _url_template = "{domain_url}/workflow/{wf_id}/{ep_name}"
 
     def __init__(self, api: FiremonAPI, app: App, wf_id: int, record=Packet):
         super().__init__(api, app, record=record)
         self._wf_id = wf_id
 
-        if self.__class__._is_domain_url and self.__class__.ep_name:
-            self.url = (
-                f"{self.domain_url}/workflow/{self._wf_id}/{self.__class__.ep_name}"
+        if self._is_domain_url and self.ep_name:
+            self.url = self._url_template.format(
+                domain_url=self.domain_url, wf_id=self._wf_id, ep_name=self.ep_name
             )
 
     def all(self) -> list[Packet]:
         siql_ep = SiqlPP(self.api, self.app)
         siql = f"ticket{{workflow={self._wf_id}}}"
         tickets = siql_ep.ticket(siql)
-        return [self.get(ticket.id) for ticket in tickets]
+        return self._load_tickets(tickets)
+
+    def _load_tickets(self, tickets: list) -> list[Packet]:
+        # The SIQL paged-search already returns the ticket payloads in
+        # one server-side batch. Build Packet records straight from
+        # those and only fall back to a per-ticket GET for hits that
+        # came back without the workflow data a Packet needs.
+        packets = []
+        missing = []
+        for ticket in tickets:
+            config = ticket.dump()
+            if config.get("workflowVersion"):
+                packets.append(self._response_loader(config))
+            else:
+                missing.append((len(packets), ticket.id))
+                packets.append(None)
+        if missing:
+            fetched = self._get_concurrent([tid for _, tid in missing])
+            for (idx, _), packet in zip(missing, fetched):
+                packets[idx] = packet
+        return packets
+
+    def _get_concurrent(self, ids: list) -> list[Packet]:
+        # Each ticket needs its own GET for the full payload. Fan the
+        # calls out over a thread pool so we are not paying the full
+        # round-trip per ticket in series.
+        with cf.ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            return list(pool.map(self.get, ids))
 
     def get(self, *args, **kwargs) -> Optional[Packet]:
         try:
@@ -333,10 +379,9 @@ class Packets(Endpoint):
             id = None
 
         if not id:
-            if kwargs:
-                filter_lookup = self.filter(**kwargs)
-            else:
-                filter_lookup = self.filter(*args)
+            # No args to pass along here: without an id the only useful
+            # inputs are the siql kwargs for filter().
+            filter_lookup = self.filter(**kwargs)
             if filter_lookup:
                 if len(filter_lookup) > 1:
                     raise ValueError(
@@ -375,7 +420,7 @@ class Packets(Endpoint):
         siql_ep = SiqlPP(self.api, self.app)
         siql = f"ticket{{{kwargs['siql']}}}"
         tickets = siql_ep.ticket(siql)
-        return [self.get(ticket.id) for ticket in tickets]
+        return self._load_tickets(tickets)
 
     def create(self, config: dict = None) -> Packet:
         """Create a workflow packet/ticket instance
@@ -95,7 +95,7 @@ class Requirements(Endpoint):
             f"{self.app_url}/policyplan/domain/{self.api.domain_id}/workflow/"
             f"{self.workflow_id}/task/{self.task_id}/packet/{self.ticket_id}"
         )
-        self.url = f"{self.domain_url}/{self.__class__.ep_name}"
+        self.url = f"{self.domain_url}/{self.ep_name}"
 
         self._ep = {
             "all": "",
@@ -111,7 +111,7 @@ class Requirements(Endpoint):
         req = Request(
             base=self.url,
             key=self._ep["all"],
-            session=self.api.session,
+            session=self.session,
         )
 
         return [self._response_loader(i) for i in req.get()]
@@ -226,7 +226,7 @@ class Changes(Endpoint):
             f"{self.app_url}/policyplan/domain/{self.api.domain_id}/workflow/"
             f"{self.workflow_id}/task/{self.task_id}/packet/{self.ticket_id}"
         )
-        self.url = f"{self.domain_url}/{self.__class__.ep_name}"
+        self.url = f"{self.domain_url}/{self.ep_name}"
 
         self._ep = {
             "all": "",
@@ -242,7 +242,7 @@ class Changes(Endpoint):
         req = Request(
             base=self.url,
             key=self._ep["all"],
-            session=self.api.session,
+            session=self.session,
         )
 
         return [self._response_loader(i) for i in req.get()]
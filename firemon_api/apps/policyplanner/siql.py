@@ -31,7 +31,7 @@ class SiqlPP(object):
         self.base_url = api.base_url
         self.app_url = app.app_url
         self.domain_url = app.domain_url
-        self.url = f"{self.app_url}/{self.__class__.ep_name}"
+        self.url = f"{self.app_url}/{self.ep_name}"
 
     def _response_loader(self, values):
         return self._return_obj(values, self.app)
@@ -49,7 +49,7 @@ class SiqlPP(object):
             base=self.url,
             key=key,
             filters=filters,
-            session=self.api.session,
+            session=self.session,
         ).get()
 
         return [self._response_loader(i) for i in resp]
@@ -67,9 +67,7 @@ class Tasks(Endpoint):
 
     ep_name = "task"
     _is_domain_url = False
-
-    def __init__(self, api: FiremonAPI, app: App, record=Task):
-        super().__init__(api, app, record=record)
+    return_obj = Task
 
     # Override the default to include "name" for our modified Record
     def _response_loader(self, values, name):
@@ -18,17 +18,19 @@ class Workflow(Record):
     _ep_name = "workflow"
     _is_domain_url = True
 
-    def __init__(self, config: dict, app: App):
-        super().__init__(config, app)
-
-        self.tickets = Packets(self._app.api, self._app, config["id"])
-
-        self._no_no_keys = [
+    _no_no_keys = frozenset(
+        (
             "createdBy",
             "createdDate",
             "lastModifiedBy",
             "lastModifiedDate",
-        ]
+        )
+    )
+
+    def __init__(self, config: dict, app: App):
+        super().__init__(config, app)
+
+        self.tickets = Packets(self._app.api, self._app, config["id"])
 
     def save(self) -> RequestResponse:
         if self.id:
@@ -103,9 +105,7 @@ class Workflows(Endpoint):
 
     ep_name = "workflow"
     _is_domain_url = True
-
-    def __init__(self, api: FiremonAPI, app: App, record=Workflow):
-        super().__init__(api, app, record=record)
+    return_obj = Workflow
 
     def create(self, name: str, config: dict = None) -> Workflow:
         """Create a new Workflow
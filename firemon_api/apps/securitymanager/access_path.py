@@ -112,11 +112,8 @@ class AccessPath(BaseRecord):
         return req.put(json=self._apa_request)
 
     def __str__(self):
-        return str("AccessPath")
+        return "AccessPath"
 
     def __repr__(self):
-        if self._device_id:
-            s = f"<{self.__class__.__name__}(dev:{self._device_id})>"
-        else:
-            s = f"<{self.__class__.__name__}>"
-        return s
+        dev = f"(dev:{self._device_id})" if self._device_id else ""
+        return f"<{self.__class__.__name__}{dev}>"
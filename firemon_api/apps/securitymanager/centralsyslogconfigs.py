@@ -38,9 +38,7 @@ class CentralSyslogConfigs(Endpoint):
 
     ep_name = "centralsyslogconfig"
     _is_domain_url = True
-
-    def __init__(self, api: FiremonAPI, app: App, record=CentralSyslogConfig):
-        super().__init__(api, app, record=record)
+    return_obj = CentralSyslogConfig
 
     def filter(self, *args, **kwargs) -> list[CentralSyslogConfig]:
         """
@@ -24,12 +24,12 @@ class CentralSyslog(Record):
     _is_domain_url = True
     centralSyslogConfig = CentralSyslogConfig
 
+    # not needed for `serialize` update using ep function
+    _no_no_keys = frozenset(("centralSyslogConfig",))
+
     def __init__(self, config: dict, app: App):
         super().__init__(config, app)
 
-        # not needed for `serialize` update using ep function
-        self._no_no_keys = ["centralSyslogConfig"]
-
     def device_set(self, id: int) -> RequestResponse:
         """Set a device to this Central Syslog
 
@@ -105,9 +105,7 @@ class CentralSyslogs(Endpoint):
 
     ep_name = "central-syslog"
     _is_domain_url = True
-
-    def __init__(self, api: FiremonAPI, app: App, record=CentralSyslog):
-        super().__init__(api, app, record=record)
+    return_obj = CentralSyslog
 
     def _make_filters(self, values):
         # Only a 'search' for a single value. Take all key-values
@@ -42,19 +42,21 @@ class CollectionConfig(Record):
 
     _ep_name = "collectionconfig"
 
-    def __init__(self, config: dict, app: App):
-        super().__init__(
-            config,
-            app,
-        )
-
-        self._no_no_keys = [
+    _no_no_keys = frozenset(
+        (
             "index",
             "createdBy",
             "createdDate",
             "lastModifiedBy",
             "lastModifiedDate",
-        ]
+        )
+    )
+
+    def __init__(self, config: dict, app: App):
+        super().__init__(
+            config,
+            app,
+        )
 
     def devicepack_set(self) -> RequestResponse:
         """Set CollectionConfig for Device Pack assignment.
@@ -168,7 +170,7 @@ class CollectionConfigs(Endpoint):
         req = Request(
             base=self.url,
             filters=filters,
-            session=self.api.session,
+            session=self.session,
         )
 
         return [self._response_loader(i) for i in req.get()]
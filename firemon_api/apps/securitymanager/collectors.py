@@ -1,6 +1,6 @@
 # Standard packages
-# import json
 import logging
+from typing import Iterator
 
 # Local packages
 from firemon_api.core.app import App
@@ -42,11 +42,11 @@ class Collector(Record):
         )
         return req.get()
 
-    def devices(self) -> list[Device]:
+    def devices(self) -> Iterator[Device]:
         """Get all devices assigned to collector
 
         Returns:
-            list[Device]
+            Iterator[Device]: records are built lazily as consumed
         """
         key = "device"
         req = Request(
@@ -54,7 +54,9 @@ class Collector(Record):
             key=key,
             session=self._session,
         )
-        return [Device(config, self._app) for config in req.get()]
+        loader = Device
+        app = self._app
+        return (loader(config, app) for config in req.get())
 
 
 class Collectors(Endpoint):
@@ -69,9 +71,7 @@ class Collectors(Endpoint):
     """
 
     ep_name = "collector"
-
-    def __init__(self, api: FiremonAPI, app: App, record=Collector):
-        super().__init__(api, app, record=record)
+    return_obj = Collector
 
     def _make_filters(self, values):
         # Only a 'search' for a single value. Take all key-values
@@ -182,9 +182,7 @@ class CollectorGroups(Endpoint):
     """
 
     ep_name = "collector/group"
-
-    def __init__(self, api: FiremonAPI, app: App, record=CollectorGroup):
-        super().__init__(api, app, record=record)
+    return_obj = CollectorGroup
 
     def _make_filters(self, values):
         # Only a 'search' for a single value. Take all key-values
@@ -192,5 +190,20 @@ class CollectorGroups(Endpoint):
         filters = {"search": values[next(iter(values))]}
         return filters
 
-    def count(self):
-        return len(self.all())
+    def count(self) -> int:
+        """Returns the count of collector groups.
+
+        Asks the server for a single-record page and reads its total;
+        if the listing comes back as a bare array instead of a paged
+        envelope, fall back to counting the records.
+        """
+        req = Request(
+            base=self.url,
+            filters={"pageSize": 1},
+            session=self.session,
+        )
+
+        try:
+            return req.get_count()
+        except (KeyError, TypeError):
+            return len(self.all())
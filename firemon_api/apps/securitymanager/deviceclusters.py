@@ -66,6 +66,4 @@ class DeviceClusters(Endpoint):
 
     ep_name = "cluster"
     _is_domain_url = True
-
-    def __init__(self, api: FiremonAPI, app: App, record=DeviceCluster):
-        super().__init__(api, app, record=record)
+    return_obj = DeviceCluster
@@ -210,9 +210,7 @@ class DeviceGroups(Endpoint):
 
     ep_name = "devicegroup"
     _is_domain_url = True
-
-    def __init__(self, api: FiremonAPI, app: App, record=DeviceGroup):
-        super().__init__(api, app, record=record)
+    return_obj = DeviceGroup
 
     def _make_filters(self, values):
         # Only a 'search' for a single value. Take all key-values
@@ -241,7 +239,7 @@ class DeviceGroups(Endpoint):
             req = Request(
                 base=self.url,
                 key=key,
-                session=self.api.session,
+                session=self.session,
             )
             return self._response_loader(req.get())
         except ValueError:
@@ -250,7 +248,7 @@ class DeviceGroups(Endpoint):
             req = Request(
                 base=self.url,
                 key=key,
-                session=self.api.session,
+                session=self.session,
             )
             return self._response_loader(req.get())
         except IndexError:
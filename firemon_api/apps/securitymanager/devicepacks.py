@@ -162,9 +162,7 @@ class DevicePacks(Endpoint):
     """
 
     ep_name = "plugin"
-
-    def __init__(self, api: FiremonAPI, app: App, record=DevicePack):
-        super().__init__(api, app, record=record)
+    return_obj = DevicePack
 
     def all(self) -> list[DevicePack]:
         """Get all device packs
@@ -180,7 +178,7 @@ class DevicePacks(Endpoint):
             base=self.url,
             key=key,
             filters=filters,
-            session=self.api.session,
+            session=self.session,
         )
 
         return [self._response_loader(i) for i in req.get()]
@@ -1,6 +1,5 @@
 # Standard packages
 import logging
-import uuid
 from urllib.parse import quote
 from typing import Literal
 from typing import Optional
@@ -79,28 +78,45 @@ class Device(Record):
     extendedSettingsJson = JsonField
     devicePack = DevicePack
 
-    def __init__(self, config: dict, app: App):
-        super().__init__(config, app)
-
-        self._no_no_keys = [
+    _no_no_keys = frozenset(
+        (
             "securityConcernIndex",
             "gpcComputeDate",
             "gpcDirtyDate",
             "gpcImplementDate",
             "gpcStatus",
-        ]
-
-        # Add attributes to Record() so we can get more info
-        self.collectionconfigs = CollectionConfigs(
-            self._app.api,
-            self._app,
-            device_id=config["id"],
-            devicepack_id=config["devicePack"]["id"],
         )
-        self.maps = Maps(self._app.api, self._app, device_id=config["id"])
-        self.revisions = Revisions(self._app.api, self._app, device_id=config["id"])
-        self.routes = Routes(self._app.api, self._app, device_id=config["id"])
-        self.zones = Zones(self._app.api, self._app, device_id=config["id"])
+    )
+
+    def __init__(self, config: dict, app: App):
+        super().__init__(config, app)
+
+    def __getattr__(self, name: str):
+        # Child endpoints used to be built eagerly in __init__, which
+        # made every Device (and there can be hundreds per all() call)
+        # pay for five Endpoint constructions up front. Build them on
+        # first access instead and cache on the instance.
+        if name in ("collectionconfigs", "maps", "revisions", "routes", "zones"):
+            if name == "collectionconfigs":
+                ep = CollectionConfigs(
+                    self._app.api,
+                    self._app,
+                    device_id=self._config["id"],
+                    devicepack_id=self._config["devicePack"]["id"],
+                )
+            elif name == "maps":
+                ep = Maps(self._app.api, self._app, device_id=self._config["id"])
+            elif name == "revisions":
+                ep = Revisions(self._app.api, self._app, device_id=self._config["id"])
+            elif name == "routes":
+                ep = Routes(self._app.api, self._app, device_id=self._config["id"])
+            else:
+                ep = Zones(self._app.api, self._app, device_id=self._config["id"])
+            setattr(self, name, ep)
+            return ep
+        raise AttributeError(
+            f"{self.__class__.__name__!r} object has no attribute {name!r}"
+        )
 
     def save(self, retrieve: bool = False) -> RequestResponse:
         """Saves changes to an existing object.
@@ -420,7 +436,9 @@ class Device(Record):
         )
         return AccessPath(req.put(json=json), self, self.id, apa_request=json)
 
-    def rev_export(self, meta: bool = True) -> RequestResponse:
+    def rev_export(
+        self, meta: bool = True, path: Optional[str] = None
+    ) -> RequestResponse:
         """Export latest configuration files as a zip file
 
         Support files include all NORMALIZED data and other meta data.
@@ -429,9 +447,11 @@ class Device(Record):
 
         Keyword Arguments:
             meta (bool): True gets a SUPPORT file. False is Raw only
+            path (str): stream the export to this file instead of
+                buffering the whole zip in memory
 
         Returns:
-            bytes: file
+            bytes: file. Or True if written to `path`
 
         Examples:
 
@@ -442,6 +462,11 @@ class Device(Record):
             ...   f.write(support)
             ...
             38047
+
+            Stream a large export straight to disk
+
+            >>> dev.rev_export(path='support.zip')
+            True
         """
         if meta:
             key = "export"
@@ -452,6 +477,11 @@ class Device(Record):
             key=key,
             session=self._session,
         )
+        if path:
+            with open(path, "wb") as f:
+                for chunk in req.get_stream():
+                    f.write(chunk)
+            return True
         return req.get_content()
 
     def config_import(
@@ -500,15 +530,15 @@ class Device(Record):
         if not change_user:
             # Not needed as server will go on its merry way with nothing
             change_user = f"{self._app.api.username}:[firemon_api]"
-        if not correlation_id:
-            # Not needed as server will generate one for us. But... whatever.
-            correlation_id = str(uuid.uuid1())
         filters = {
             "action": action,
             "filetype": file_type,
             "changeUser": change_user,
-            "correlationId": correlation_id,
         }
+        if correlation_id:
+            # Otherwise the server generates one for us; skip the local
+            # uuid1() work (and its host MAC lookup) entirely.
+            filters["correlationId"] = correlation_id
         key = "rev"
 
         req = Request(
@@ -675,7 +705,7 @@ class Device(Record):
         Returns:
             dict
         """
-        key = f"capabilities"
+        key = "capabilities"
         req = Request(
             base=self._url,
             key=key,
@@ -689,7 +719,7 @@ class Device(Record):
         Returns:
             dict
         """
-        key = f"status"
+        key = "status"
         req = Request(
             base=self._url,
             key=key,
@@ -703,7 +733,7 @@ class Device(Record):
         Returns:
             dict
         """
-        key = f"health"
+        key = "health"
         req = Request(
             base=self._url,
             key=key,
@@ -836,7 +866,7 @@ class Device(Record):
             RuleRecommendation
 
         """
-        key = f"rulerec"
+        key = "rulerec"
         filters = {}
         if license_category:
             filters["licenseCategory"] = license_category
@@ -868,8 +898,9 @@ class Devices(Endpoint):
 
     ep_name = "device"
     _is_domain_url = True
+    return_obj = Device
 
-    def __init__(self, api: FiremonAPI, app: App, record=Device):
+    def __init__(self, api: FiremonAPI, app: App, record=None):
         super().__init__(api, app, record=record)
         self._ep.update({"filter": "filter"})
 
@@ -927,7 +958,7 @@ class Devices(Endpoint):
         req = Request(
             base=self.url,
             key=key,
-            session=self.api.session,
+            session=self.session,
         )
 
         return self._response_loader(req.get())
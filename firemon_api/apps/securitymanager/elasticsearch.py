@@ -27,7 +27,7 @@ class ElasticSearch(object):
         self.app = app
         self.base_url = api.base_url
         self.app_url = app.app_url
-        self.url = f"{self.app_url}/{self.__class__.ep_name}"
+        self.url = f"{self.app_url}/{self.ep_name}"
 
     def reindex(self) -> RequestResponse:
         """Mark Elastic Search for reindex
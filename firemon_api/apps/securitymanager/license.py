@@ -31,7 +31,7 @@ class License(Endpoint):
     def all(self) -> RequestResponse:
         req = Request(
             base=self.url,
-            session=self.api.session,
+            session=self.session,
         )
 
         return req.get()
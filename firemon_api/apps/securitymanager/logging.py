@@ -100,9 +100,7 @@ class Logging(Endpoint):
     """
 
     ep_name = "logging"
-
-    def __init__(self, api: FiremonAPI, app: App, record=Logger):
-        super().__init__(api, app, record=record)
+    return_obj = Logger
 
     def all(self) -> list[Logger]:
         """Get all SecMgr loggers
@@ -114,7 +112,7 @@ class Logging(Endpoint):
 
         req = Request(
             base=self.url,
-            session=self.api.session,
+            session=self.session,
         )
 
         return [self._response_loader(i) for i in req.get()["loggingLevels"]]
@@ -205,5 +203,5 @@ class Logging(Endpoint):
         Request(
             base=self.url,
             key=key,
-            session=self.api.session,
+            session=self.session,
         ).delete()
@@ -63,14 +63,14 @@ class Maps(BaseEndpoint):
         self._device_id = device_id
         self._group_id = group_id
 
+        # Pick the owning segment then compose the url in one join.
         if self._device_id:
-            self.url = (
-                f"{self.domain_url}/device/{self._device_id}/{self.__class__.ep_name}"
-            )
+            scope = ("device", str(self._device_id))
         elif self._group_id:
-            self.url = f"{self.domain_url}/devicegroup/{self._group_id}/{self.__class__.ep_name}"
+            scope = ("devicegroup", str(self._group_id))
         else:
-            self.url = f"{self.domain_url}/devicegroup/1/{self.__class__.ep_name}"
+            scope = ("devicegroup", "1")
+        self.url = "/".join((self.domain_url, *scope, self.ep_name))
 
     def _response_loader(self, values):
         return self.return_obj(
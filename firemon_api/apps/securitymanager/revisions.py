@@ -243,9 +243,9 @@ class Revisions(Endpoint):
             list[Revision]: a list of Revision()
         """
         if self._device_id:
-            all_key = f"device/{self._device_id}/{self.__class__.ep_name}"
+            all_key = f"device/{self._device_id}/{self.ep_name}"
         else:
-            all_key = f"{self.__class__.ep_name}"
+            all_key = f"{self.ep_name}"
 
         req = Request(
             base=self.domain_url,
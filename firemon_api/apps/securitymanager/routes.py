@@ -64,9 +64,9 @@ class Routes(Endpoint):
     def all(self) -> list[Route]:
         """Get all `Record`"""
         if self._device_id:
-            all_key = f"device/{self._device_id}/{self.__class__.ep_name}"
+            all_key = f"device/{self._device_id}/{self.ep_name}"
         else:
-            all_key = f"{self.__class__.ep_name}"
+            all_key = f"{self.ep_name}"
 
         req = Request(
             base=self.domain_url,
@@ -38,7 +38,7 @@ class Siql(object):
         self.base_url = api.base_url
         self.app_url = app.app_url
         self.domain_url = app.domain_url
-        self.url = f"{self.app_url}/{self.__class__.ep_name}"
+        self.url = f"{self.app_url}/{self.ep_name}"
 
     def _response_loader(self, values):
         return self.return_obj(values, self.app)
@@ -75,7 +75,7 @@ class Siql(object):
             base=self.url,
             key=key,
             filters=filters,
-            session=self.api.session,
+            session=self.session,
         ).get()
 
         return [self._response_loader(i) for i in resp]
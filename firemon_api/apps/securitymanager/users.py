@@ -1,5 +1,7 @@
 # Standard packages
+import concurrent.futures as cf
 import logging
+import time
 from typing import Optional
 
 # Local packages
@@ -8,10 +10,32 @@ from firemon_api.core.api import FiremonAPI
 from firemon_api.core.endpoint import Endpoint
 from firemon_api.core.errors import SecurityManagerError
 from firemon_api.core.response import Record, BaseRecord
-from firemon_api.core.query import Request, RequestResponse, RequestError
+from firemon_api.core.query import MAX_WORKERS, Request, RequestResponse, RequestError
 
 log = logging.getLogger(__name__)
 
+# Permission definitions only change with the FMOS version, so cache
+# the raw response per domain url for a while instead of re-fetching
+# on every permission_list() call.
+_PERM_DEF_CACHE: dict = {}
+_PERM_DEF_TTL = 300.0  # seconds
+
+# Baseline config for Users.template(). Copied per call.
+_USER_TEMPLATE = {
+    "username": None,
+    "firstName": None,
+    "lastName": None,
+    "email": None,
+    "password": None,
+    "existingPassword": None,
+    "passwordExpired": False,
+    "locked": False,
+    "expired": False,
+    "enabled": True,
+    "authType": "LOCAL",
+    "authServerId": None,  # 0
+}
+
 
 class UsersError(SecurityManagerError):
     pass
@@ -97,9 +121,7 @@ class Users(Endpoint):
 
     ep_name = "user"
     _is_domain_url = True
-
-    def __init__(self, api: FiremonAPI, app: App, record=User):
-        super().__init__(api, app, record=record)
+    return_obj = User
 
     def _make_filters(self, values):
         # Only a 'search' for a single value. Take all key-values
@@ -119,7 +141,7 @@ class Users(Endpoint):
         req = Request(
             base=self.url,
             filters=filters,
-            session=self.api.session,
+            session=self.session,
         )
 
         return [self._response_loader(i) for i in req.get()]
@@ -139,11 +161,11 @@ class Users(Endpoint):
 
         base_url = None
         if system_user:
-            base_url = f"{self.app_url}/{self.__class__.ep_name}"
+            base_url = f"{self.app_url}/{self.ep_name}"
 
         req = Request(
             base=base_url if base_url else self.url,
-            session=self.api.session,
+            session=self.session,
         ).post(json=user_config)
 
         if isinstance(req, list):
@@ -174,14 +196,14 @@ class Users(Endpoint):
             req = Request(
                 base=self.url,
                 key=key,
-                session=self.api.session,
+                session=self.session,
             )
             return self._response_loader(req.get())
         except ValueError:
-            # Attempt to get the 'username'
-            user_all = self.all()
+            # Attempt to get the 'username'. Let the server narrow the
+            # candidates instead of downloading every user and scanning.
             id = args[0]
-            user_l = [user for user in user_all if user.username == id]
+            user_l = [user for user in self.filter(id) if user.username == id]
             if len(user_l) == 1:
                 return user_l[0]
             else:
@@ -211,20 +233,7 @@ class Users(Endpoint):
         Return:
             dict: dictionary of data to pass to create
         """
-        conf = {}
-        conf["username"] = None
-        conf["firstName"] = None
-        conf["lastName"] = None
-        conf["email"] = None
-        conf["password"] = None
-        conf["existingPassword"] = None
-        conf["passwordExpired"] = False
-        conf["locked"] = False
-        conf["expired"] = False
-        conf["enabled"] = True
-        conf["authType"] = "LOCAL"
-        conf["authServerId"] = None  # 0
-        return conf
+        return _USER_TEMPLATE.copy()
 
 
 class UserGroup(Record):
@@ -249,11 +258,18 @@ class UserGroup(Record):
         """
 
         key = "permissiondefinition"
-        resp = Request(
-            base=self._app.domain_url,
-            key=key,
-            session=self._session,
-        ).get()
+        cached = _PERM_DEF_CACHE.get(self._app.domain_url)
+        if cached and time.monotonic() - cached[0] < _PERM_DEF_TTL:
+            resp = cached[1]
+        else:
+            # Conditional get: once the TTL lapses a matching ETag
+            # turns the refresh into a body-less 304.
+            resp = Request(
+                base=self._app.domain_url,
+                key=key,
+                session=self._session,
+            ).get_conditional()
+            _PERM_DEF_CACHE[self._app.domain_url] = (time.monotonic(), resp)
 
         perms = []
         for rg in resp:
@@ -317,6 +333,34 @@ class UserGroup(Record):
 
         return resp
 
+    def permission_set_bulk(self, ids: list[int]) -> RequestResponse:
+        """Set many permissions for UserGroup.
+
+        The API only exposes a per-id permission endpoint, so the calls
+        are fanned out concurrently over the pooled session rather than
+        issued one at a time.
+
+        Parameters:
+            ids (list[int]): see permission_list() for id values
+
+        Returns:
+            bool: True if every set succeeded
+        """
+        with cf.ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            return all(pool.map(self.permission_set, ids))
+
+    def permission_unset_bulk(self, ids: list[int]) -> RequestResponse:
+        """Unset many permissions for UserGroup.
+
+        Parameters:
+            ids (list[int]): see permission_list() for id values
+
+        Returns:
+            bool: True if every unset succeeded
+        """
+        with cf.ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            return all(pool.map(self.permission_unset, ids))
+
 
 class UserGroups(Endpoint):
     """Represents the User Groups
@@ -332,9 +376,7 @@ class UserGroups(Endpoint):
 
     ep_name = "usergroup"
     _is_domain_url = True
-
-    def __init__(self, api: FiremonAPI, app: App, record=UserGroup):
-        super().__init__(api, app, record=record)
+    return_obj = UserGroup
 
     def all(self) -> list[UserGroup]:
         """Get all `Record`"""
@@ -343,7 +385,7 @@ class UserGroups(Endpoint):
         req = Request(
             base=self.url,
             filters=filters,
-            session=self.api.session,
+            session=self.session,
         )
 
         return [self._response_loader(i) for i in req.get()]
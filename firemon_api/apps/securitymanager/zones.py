@@ -1,5 +1,8 @@
 # Standard packages
 import logging
+import threading
+import time
+from operator import attrgetter
 from typing import Optional
 
 # Local packages
@@ -12,6 +15,10 @@ from firemon_api.core.query import Request, RequestResponse
 
 log = logging.getLogger(__name__)
 
+# Sentinel for attribute lookups so a kwarg of None cannot match a
+# missing attribute.
+_MISS = object()
+
 
 class ZonesError(SecurityManagerError):
     pass
@@ -65,31 +72,100 @@ class Zones(Endpoint):
     ):
         super().__init__(api, app, record=record)
         self._device_id = device_id
+        # The device scope is fixed for the life of the endpoint, so
+        # resolve the request key once rather than per call.
+        if device_id:
+            self._all_key = f"device/{device_id}/{self.ep_name}"
+        else:
+            self._all_key = self.ep_name
+        # Zone listings rarely change mid-script and back-to-back
+        # get()/filter() calls would otherwise re-download the lot.
+        self._all_cache: Optional[list[Zone]] = None
+        self._all_cache_ts = 0.0
+        self._all_ttl = 30.0  # seconds
+        # Name index over the cached listing. Zone names repeat across
+        # devices so each entry is a list.
+        self._by_name: Optional[dict] = None
+        # Single-flight guard: concurrent all() calls on a cold cache
+        # share one fetch instead of each paging down the listing.
+        self._all_lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Drop the cached all() listing so the next call refetches."""
+        self._all_cache = None
+        self._all_cache_ts = 0.0
+        self._by_name = None
+
+    def _cached_all(self) -> Optional[list["Zone"]]:
+        if (
+            self._all_cache is not None
+            and time.monotonic() - self._all_cache_ts < self._all_ttl
+        ):
+            return self._all_cache
+        return None
 
     def _make_filters(self, values):
         """Yet another filter that is doing its own thing."""
         filters = {"q": values[next(iter(values))]}
         return filters
 
-    def all(self) -> list[Zone]:
+    def all(self, fields: Optional[list[str]] = None) -> list[Zone]:
         """Get all `Record`
 
+        Keyword Arguments:
+            fields (list): optional field names to project server side.
+                `deviceid` is always included since `Zone` urls are
+                built from it. Projected listings bypass the cache.
+
         Returns:
             list[Zone]
         """
-        if self._device_id:
-            all_key = f"device/{self._device_id}/{self.__class__.ep_name}"
-        else:
-            all_key = f"{self.__class__.ep_name}"
-
-        req = Request(
-            base=self.domain_url,
-            key=all_key,
-            session=self.session,
-        )
-
-        revs = [self._response_loader(i) for i in req.get()]
-        return sorted(revs, key=lambda x: x.deviceid, reverse=True)
+        if fields:
+            # Zone._url_create dereferences deviceid on load, so it
+            # cannot be projected away.
+            if "deviceid" not in fields:
+                fields = [*fields, "deviceid"]
+            req = Request(
+                base=self.domain_url,
+                key=self._all_key,
+                filters={"fields": ",".join(fields)},
+                session=self.session,
+            )
+            return sorted(
+                (self._response_loader(i) for i in req.get()),
+                key=attrgetter("deviceid"),
+                reverse=True,
+            )
+
+        cached = self._cached_all()
+        if cached is not None:
+            return cached
+
+        with self._all_lock:
+            # Whoever held the lock first has filled the cache by now.
+            cached = self._cached_all()
+            if cached is not None:
+                return cached
+
+            req = Request(
+                base=self.domain_url,
+                key=self._all_key,
+                session=self.session,
+            )
+
+            revs = sorted(
+                (self._response_loader(i) for i in req.get()),
+                key=attrgetter("deviceid"),
+                reverse=True,
+            )
+            by_name: dict = {}
+            for zone in revs:
+                by_name.setdefault(zone.name, []).append(zone)
+
+            self._all_cache = revs
+            self._by_name = by_name
+            self._all_cache_ts = time.monotonic()
+            return revs
 
     def get(self, *args, **kwargs) -> Optional[Zone]:
         """Query and retrieve individual Zones. Spelling matters.
@@ -108,21 +184,31 @@ class Zones(Endpoint):
             >>> fm.sm.dp.get(matchId='6014fd68-010d-4437-80cb-8fd4807ba73b')
         """
 
-        zone_all = self.all()
         try:
-            # Only getting exact matches
+            # Only getting exact matches. The server narrows the
+            # candidates down with its search query first so we do not
+            # page down every zone just to scan for one name.
             id = args[0]
-            zone_l = [zone for zone in zone_all if zone.name == id]
-            if len(zone_l) > 1:
-                raise ValueError(
-                    "get() returned more than one result."
-                    "Check the kwarg(s) passed are valid or"
-                    "use filter() or all() instead."
-                )
-            elif len(zone_l) == 1:
-                return zone_l[0]
+            if self._cached_all() is not None:
+                # A fresh all() listing is indexed by name; a lookup
+                # beats another round trip.
+                candidates = self._by_name.get(id, [])
             else:
-                raise ZonesError(f"The requested zone: {id} could not " "be found")
+                candidates = (zone for zone in self.filter(name=id) if zone.name == id)
+            # Names should be unique so stop at the first hit and only
+            # keep looking long enough to catch an ambiguous second.
+            found = None
+            for zone in candidates:
+                if found is not None:
+                    raise ValueError(
+                        "get() returned more than one result."
+                        "Check the kwarg(s) passed are valid or"
+                        "use filter() or all() instead."
+                    )
+                found = zone
+            if found:
+                return found
+            raise ZonesError(f"The requested zone: {id} could not " "be found")
         except IndexError:
             id = None
 
@@ -153,11 +239,31 @@ class Zones(Endpoint):
         >>> fm.sm.zones.filter(type="ANY")
         """
 
-        zone_all = self.all()
         if not kwargs:
             raise ValueError("filter must have kwargs")
 
-        return [zone for zone in zone_all if kwargs.items() <= dict(zone).items()]
+        # `q` is a free-text search, so only a name narrows safely
+        # server side; a value like type="ANY" would silently drop
+        # zones that do not happen to text-match it. Anything else
+        # scans the full listing client side as before.
+        if "name" in kwargs:
+            req = Request(
+                base=self.domain_url,
+                key=self._all_key,
+                filters=self._make_filters({"name": kwargs["name"]}),
+                session=self.session,
+            )
+            zones = [self._response_loader(i) for i in req.get()]
+        else:
+            zones = self.all()
+
+        # Compare the requested attributes directly rather than casting
+        # every candidate to a dict just for a subset test.
+        return [
+            zone
+            for zone in zones
+            if all(getattr(zone, k, _MISS) == v for k, v in kwargs.items())
+        ]
 
 
 class FmZone(BaseRecord):
@@ -8,6 +8,8 @@ from typing import Optional
 
 # Third-Party packages
 import requests  # performing web requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
 
 # Local packages
 import firemon_api
@@ -87,10 +89,21 @@ class FiremonAPI(object):
         self.cert = cert
 
         self.session = requests.Session()
+        # Size the connection pool so bulk retrievals (and the threaded
+        # paged gets in `query.Request`) re-use keep-alive connections
+        # instead of paying a TCP+TLS handshake per call.
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         # self.session.auth = (self.username, self.password)  # Basic auth is used
         self.default_headers = {
             "User-Agent": f"py-firemon-api/{firemon_api.__version__}",
-            "Accept-Encoding": "gzip, deflate",
+            # Advertise every compression urllib3 can actually decode
+            # (adds brotli/zstd when those packages are installed)
+            # rather than pinning gzip/deflate. Some proxies strip the
+            # header, so set it explicitly instead of relying on the
+            # library default surviving the trip.
+            "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
             "Accept": "*/*",
             "Connection": "keep-alive",
         }
@@ -1,3 +1,4 @@
+import functools
 import logging
 from typing import Callable, Optional
 
@@ -25,89 +26,80 @@ class DynamicApi(object):
         self.session = session
         self.app_url = app_url
         self.url = None
-        for path in dynamic_api["paths"].keys():
-            for verb in dynamic_api["paths"][path].keys():
-                oid = dynamic_api["paths"][path][verb]["operationId"]
-                _method = self._make_method(path, verb)
-                setattr(self, oid, _method)
+        # Collect all the methods and bind them in one shot rather than
+        # a setattr per operation.
+        methods = {}
+        for path, verbs in dynamic_api["paths"].items():
+            for verb, spec in verbs.items():
+                methods[spec["operationId"]] = self._make_method(path, verb)
+        self.__dict__.update(methods)
 
     def _make_method(self, path: str, verb: str) -> Callable:
+        # Pre-compute the key template once at build time. Paths with no
+        # place-holders skip str.format() entirely on every call.
+        if verb not in ("get", "put", "post", "delete"):
+            return None
+        p = path.lstrip("/")
+        static = "{" not in p
+        return functools.partial(self._dispatch, verb, p, static)
+
+    def _dispatch(
+        self,
+        verb: str,
+        p: str,
+        static: bool,
+        filters=None,
+        add_params=None,
+        data=None,
+        files=None,
+        **kwargs,
+    ) -> RequestResponse:
+        # Single dispatcher shared by every generated method. A partial
+        # per operation is far lighter than a dedicated closure each.
+        key = p if static else p.format(**kwargs)
+        req = Request(
+            base=self.app_url,
+            key=key,
+            filters=filters,
+            session=self.session,
+        )
         if verb == "get":
-
-            def _method(filters=None, add_params=None, **kwargs):
-                p = path.lstrip("/")
-                key = p.format(**kwargs)
-                filters = filters
-                req = Request(
-                    base=self.app_url,
-                    key=key,
-                    filters=filters,
-                    session=self.session,
-                )
-                return req.get(add_params=add_params)
-
-            return _method
-
+            return req.get(add_params=add_params)
         elif verb == "put":
-
-            def _method(filters=None, data=None, **kwargs):
-                p = path.lstrip("/")
-                key = p.format(**kwargs)
-                filters = filters
-                req = Request(
-                    base=self.app_url,
-                    key=key,
-                    filters=filters,
-                    session=self.session,
-                )
-                return req.put(data=data)
-
-            return _method
-
+            return req.put(data=data)
         elif verb == "post":
-
-            def _method(filters=None, data=None, files=None, **kwargs):
-                p = path.lstrip("/")
-                key = p.format(**kwargs)
-                filters = filters
-                req = Request(
-                    base=self.app_url,
-                    key=key,
-                    filters=filters,
-                    session=self.session,
-                )
-                return req.post()
-
-            return _method
-
-        elif verb == "delete":
-
-            def _method(filters=None, **kwargs):
-                p = path.lstrip("/")
-                key = p.format(**kwargs)
-                filters = filters
-                req = Request(
-                    base=self.app_url,
-                    key=key,
-                    filters=filters,
-                    session=self.session,
-                )
-                return req.delete()
-
-            return _method
+            return req.post(data=data, files=files)
+        return req.delete()
 
 
 class App(object):
     """Base class for Firemon Apps"""
 
     name = None
+    # attribute name -> Endpoint class. Endpoints are constructed
+    # lazily on first access and cached on the instance.
+    _endpoints: dict = {}
 
     def __init__(self, api: FiremonAPI):
         self.api = api
         self.session = api.session
         self.base_url = api.base_url
-        self.app_url = f"{api.base_url}/{self.__class__.name}/api"
+        self.app_url = f"{api.base_url}/{self.name}/api"
         self.domain_url = f"{self.app_url}/domain/{str(self.api.domain_id)}"
+        self._api_spec = None
+
+    def __getattr__(self, name: str):
+        # Only called when normal lookup fails; build the requested
+        # endpoint on demand so App construction stays cheap.
+        try:
+            ep_cls = self._endpoints[name]
+        except KeyError:
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            ) from None
+        ep = ep_cls(self.api, self)
+        setattr(self, name, ep)
+        return ep
 
     def set_api(self) -> RequestResponse:
         """Attempt to auto create all api calls by reading
@@ -117,18 +109,24 @@ class App(object):
         All auto created methods get setattr on `exec` for `App`.
         """
         _dynamic_api = self.get_api()
-        setattr(self, "exec", DynamicApi(_dynamic_api, self.api.session, self.app_url))
+        setattr(self, "exec", DynamicApi(_dynamic_api, self.session, self.app_url))
 
     def get_api(self) -> RequestResponse:
-        """Return API specs from the dynamic documentation"""
+        """Return API specs from the dynamic documentation
 
-        key = "openapi.json"
-        req = Request(
-            base=self.app_url,
-            key=key,
-            session=self.session,
-        )
-        return req.get()
+        The spec only changes with the FMOS version so it is fetched
+        once and cached for the life of the App.
+        """
+
+        if self._api_spec is None:
+            key = "openapi.json"
+            req = Request(
+                base=self.app_url,
+                key=key,
+                session=self.session,
+            )
+            self._api_spec = req.get()
+        return self._api_spec
 
     def request(
         self,
@@ -1,10 +1,11 @@
 # Standard modules
-from typing import Optional, Union
+import concurrent.futures as cf
+from typing import Iterator, Optional, Union
 
 # Local packages
 from firemon_api.core.api import FiremonAPI
 from firemon_api.core.app import App
-from firemon_api.core.query import Request
+from firemon_api.core.query import MAX_WORKERS, Request
 from firemon_api.core.response import BaseRecord, Record, JsonField
 
 
@@ -20,6 +21,10 @@ class BaseEndpoint(object):
     url = None
     ep_name = None
     _is_domain_url = False
+    # Default `Record` class for this endpoint. Subclasses just set
+    # this alongside `ep_name` instead of repeating an `__init__` whose
+    # only job is to forward `record=`.
+    return_obj = BaseRecord
 
     def __init__(
         self,
@@ -29,18 +34,16 @@ class BaseEndpoint(object):
     ):
         if record:
             self.return_obj = record
-        else:
-            self.return_obj = BaseRecord
         self.api = api
         self.session = api.session
         self.app = app
         self.base_url = api.base_url
         self.app_url = app.app_url
         self.domain_url = app.domain_url
-        if self.__class__._is_domain_url and self.__class__.ep_name:
-            self.url = f"{self.domain_url}/{self.__class__.ep_name}"
-        elif self.__class__.ep_name:
-            self.url = f"{self.app_url}/{self.__class__.ep_name}"
+        if self._is_domain_url and self.ep_name:
+            self.url = f"{self.domain_url}/{self.ep_name}"
+        elif self.ep_name:
+            self.url = f"{self.app_url}/{self.ep_name}"
         else:
             self.url = self.app_url
 
@@ -85,16 +88,42 @@ class Endpoint(BaseEndpoint):
         filters = {"filter": l}
         return filters
 
-    def all(self) -> list[Record]:
-        """Get all `Record`"""
+    def all(self, fields: Optional[list[str]] = None) -> list[Record]:
+        """Get all `Record`
+
+        Keyword Arguments:
+            fields (list): optional field names to project server side.
+                Only the named fields come back per record, which
+                shrinks large listings considerably. Endpoints that do
+                not understand the parameter ignore it and return full
+                records.
+        """
         req = Request(
             base=self.url,
+            filters={"fields": ",".join(fields)} if fields else None,
             key=self._ep["all"],
-            session=self.api.session,
+            session=self.session,
         )
 
         return [self._response_loader(i) for i in req.get()]
 
+    def iter_all(self, fields: Optional[list[str]] = None) -> Iterator[Record]:
+        """Iterate all `Record` lazily.
+
+        A generator twin of `all()`: records are yielded as pages
+        arrive so only one page is held in memory and callers that
+        break out early never fetch the remaining pages.
+        """
+        req = Request(
+            base=self.url,
+            filters={"fields": ",".join(fields)} if fields else None,
+            key=self._ep["all"],
+            session=self.session,
+        )
+
+        for i in req.iter_get():
+            yield self._response_loader(i)
+
     def get(self, *args, **kwargs) -> Record:
         """Get single Record
 
@@ -139,7 +168,7 @@ class Endpoint(BaseEndpoint):
         req = Request(
             base=self.url,
             key=key,
-            session=self.api.session,
+            session=self.session,
         )
 
         return self._response_loader(req.get())
@@ -162,12 +191,49 @@ class Endpoint(BaseEndpoint):
             base=self.url,
             filters=filters,
             key=self._ep["filter"],
-            session=self.api.session,
+            session=self.session,
         )
 
         ret = [self._response_loader(i) for i in req.get()]
         return ret
 
+    def iter_filter(self, *args, **kwargs) -> Iterator[Record]:
+        """Lazily iterate filtered `Record`. See `iter_all()`."""
+
+        if args:
+            kwargs.update({"name": args[0]})
+
+        if not kwargs:
+            raise ValueError(
+                "filter must be passed kwargs. Perhaps use iter_all() instead."
+            )
+
+        req = Request(
+            base=self.url,
+            filters=self._make_filters(kwargs),
+            key=self._ep["filter"],
+            session=self.session,
+        )
+
+        for i in req.iter_get():
+            yield self._response_loader(i)
+
+    def get_bulk(self, ids: list) -> list[Record]:
+        """Get many Records by id, fetched concurrently.
+
+        The fan-out rides the shared pooled session on a thread pool,
+        which keeps the requests/tenacity plumbing (retries included)
+        intact for every call. Result order matches `ids`.
+
+        Parameters:
+            ids (list): ids to retrieve
+
+        Return:
+            list: a list of Record
+        """
+        with cf.ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            return list(pool.map(self.get, ids))
+
     def create(self, *args, **kwargs) -> Record:
         """Creates an object on an endpoint.
 
@@ -184,7 +250,7 @@ class Endpoint(BaseEndpoint):
         req = Request(
             base=self.url,
             key=self._ep["create"],
-            session=self.api.session,
+            session=self.session,
         ).post(json=args[0] if args else kwargs)
 
         if isinstance(req, list):
@@ -201,13 +267,13 @@ class Endpoint(BaseEndpoint):
         ret = Request(
             base=self.url,
             key=self._ep["count"],
-            session=self.api.session,
+            session=self.session,
         )
 
         return ret.get_count()
 
     def __repr__(self):
-        return str(f"<{self.__class__.__name__}({self.url})>")
+        return f"<{self.__class__.__name__}({self.url})>"
 
     def __str__(self):
         return f"{self.url}"
@@ -1,13 +1,12 @@
 # Standard packages
 import concurrent.futures as cf
 
-from json.decoder import JSONDecodeError
 import logging
 from typing import Union, Optional
-from urllib.parse import urlencode
 
 
 # third-party
+import orjson
 from requests import Session
 from tenacity import (
     before_sleep_log,
@@ -23,17 +22,31 @@ log = logging.getLogger(__name__)
 
 RequestResponse = Union[bool, dict, str, bytes]
 
+# Worker count for threaded fan-out (paged gets, per-record fetch
+# loops). One place to tune instead of magic numbers per call site.
+MAX_WORKERS = 4
 
-def url_param_builder(param_dict: dict) -> str:
-    """Builds url parameters
-    Creates URL paramters (e.g. '.../?xyz=r21&abc=123') from a dict passed in param_dict
-    """
-    return f"?{urlencode(param_dict)}"
+# Default page size for paged GETs. Large pages mean far fewer round
+# trips on big installs; endpoints that cap lower get a 400 and we
+# retry once with the old conservative size.
+PAGE_SIZE = 1000
+_PAGE_SIZE_FALLBACK = 100
+
+# ETag cache for conditional gets: url -> (etag, parsed body)
+_ETAG_CACHE: dict = {}
+
+# Default header sets. Built once here instead of a fresh dict per call.
+_HEADERS_MULTIPART = {"Content-Type": "multipart/form-data"}
+_HEADERS_JSON = {"Content-Type": "application/json;"}
+_HEADERS_ACCEPT_JSON = {"accept": "application/json;"}
 
 
 def calc_pages(pageSize: int, total: int) -> int:
     """Calculate number of pages required for full results set."""
-    return int(total / pageSize) + (pageSize % total > 0)
+    # Ceiling division. The old modulo arithmetic had the operands
+    # backwards, requesting an extra empty page whenever the total was
+    # an exact multiple of the page size and zero pages for tiny sets.
+    return -(-total // pageSize)
 
 
 class RequestError(FiremonApiError):
@@ -82,6 +95,19 @@ class Request(object):
 
     """
 
+    # A Request is built for nearly every API call so keep the
+    # per-instance footprint fixed.
+    __slots__ = (
+        "base",
+        "session",
+        "filters",
+        "verify",
+        "key",
+        "url",
+        "headers",
+        "cookies",
+    )
+
     def __init__(
         self,
         base: str,
@@ -136,11 +162,11 @@ class Request(object):
             headers = self.headers
         else:
             if verb in ("post") and files:
-                headers = {"Content-Type": "multipart/form-data"}
+                headers = _HEADERS_MULTIPART
             elif verb in ("post", "put"):
-                headers = {"Content-Type": "application/json;"}
+                headers = _HEADERS_JSON
             else:
-                headers = {"accept": "application/json;"}
+                headers = _HEADERS_ACCEPT_JSON
 
         params = {}
         if not url_override:
@@ -149,16 +175,20 @@ class Request(object):
             if add_params:
                 params.update(add_params)
 
+        # requests encodes the query string itself; no need to build a
+        # second copy here just for the log line.
+        log.info(f"{verb.upper()}: {url_override or self.url}")
         if params:
-            log.info(
-                f"{verb.upper()}: {url_override or f'{self.url}?{urlencode(params, doseq=True)}'}"
-            )
-        else:
-            log.info(f"{verb.upper()}: {url_override or f'{self.url}'}")
+            log.debug(f"Params: {params}")
 
         if json:
             log.info(f"Json: {json}")
-        if data:
+            # Pre-serialize with orjson and send as the request body.
+            # Much faster than letting `requests` run the payload
+            # through the stdlib json encoder.
+            data = orjson.dumps(json, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+            json = None
+        elif data:
             log.info(f"Data: {data}")
         if files:
             log.info("Files present")
@@ -185,8 +215,8 @@ class Request(object):
                 raise RequestError(req)
         elif req.ok:
             try:
-                return req.json()
-            except JSONDecodeError:
+                return orjson.loads(req.content)
+            except orjson.JSONDecodeError:
                 # Assuming an empty body or data download
                 if req.content:
                     return req.content
@@ -197,7 +227,7 @@ class Request(object):
 
     def concurrent_get(self, ret: dict, page_size: int, page_range: list) -> None:
         futures_to_results = []
-        with cf.ThreadPoolExecutor(max_workers=4) as pool:
+        with cf.ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
             for page in page_range:
                 new_params = {"page": page, "pageSize": page_size}
                 futures_to_results.append(
@@ -221,8 +251,16 @@ class Request(object):
         """
         if add_params is None:
             # Hopefully this will cut down on queries without breaking things
-            add_params = {"pageSize": 100}
-        req = self._make_call(add_params=add_params)
+            add_params = {"pageSize": PAGE_SIZE}
+            try:
+                req = self._make_call(add_params=add_params)
+            except RequestError as e:
+                if e.req.status_code != 400:
+                    raise
+                add_params = {"pageSize": _PAGE_SIZE_FALLBACK}
+                req = self._make_call(add_params=add_params)
+        else:
+            req = self._make_call(add_params=add_params)
         if isinstance(req, dict) and req.get("results") is not None:
             ret = req["results"]
             if req.get("total"):
@@ -244,6 +282,44 @@ class Request(object):
         else:
             return req
 
+    def iter_get(self, add_params=None):
+        """Makes a GET request, yielding results lazily.
+        A generator twin of `get` for paginated endpoints: rows are
+        yielded as each page arrives, so only one page is ever held in
+        memory and callers that stop early never pay for later pages.
+        Pages are fetched sequentially for that reason; use `get` when
+        the full list is wanted anyway.
+
+        Raises:
+            RequestError: if req.ok returns false.
+
+        Yields:
+            dict: each result row from the endpoint.
+        """
+        if add_params is None:
+            add_params = {"pageSize": PAGE_SIZE}
+            try:
+                req = self._make_call(add_params=add_params)
+            except RequestError as e:
+                if e.req.status_code != 400:
+                    raise
+                add_params = {"pageSize": _PAGE_SIZE_FALLBACK}
+                req = self._make_call(add_params=add_params)
+        else:
+            req = self._make_call(add_params=add_params)
+
+        if isinstance(req, dict) and req.get("results") is not None:
+            yield from req["results"]
+            if req.get("total"):
+                page_size = req["pageSize"]
+                for page in range(1, calc_pages(page_size, req["total"])):
+                    new_params = dict(add_params, page=page, pageSize=page_size)
+                    yield from self._make_call(add_params=new_params)["results"]
+        elif isinstance(req, list):
+            yield from req
+        else:
+            yield req
+
     def put(self, json=None, data=None) -> RequestResponse:
         """Makes PUT request.
         Makes a PUT request to Firemon API. Not sure why we have PUT statements
@@ -322,6 +398,70 @@ class Request(object):
         else:
             raise RequestError(req)
 
+    def get_conditional(self) -> RequestResponse:
+        """Makes a conditional GET request.
+
+        Sends If-None-Match with the last seen ETag for this url; on a
+        304 the previously parsed body is returned without the server
+        re-sending (or us re-parsing) the payload. Endpoints that never
+        hand out an ETag just behave like a plain single-page get.
+
+        Raises:
+            RequestError: if req.ok returns false.
+
+        Returns:
+            dict: data from the endpoint.
+        """
+        cached = _ETAG_CACHE.get(self.url)
+        headers = (
+            dict(self.headers) if self.headers else {"accept": "application/json;"}
+        )
+        if cached:
+            headers["If-None-Match"] = cached[0]
+
+        log.info(f"GET: {self.url}")
+        req = self.session.get(
+            self.url,
+            headers=headers,
+            params=self.filters or {},
+            verify=self.verify,
+            cookies=self.cookies,
+        )
+        if req.status_code == 304 and cached:
+            return cached[1]
+        if req.ok:
+            try:
+                ret = orjson.loads(req.content)
+            except orjson.JSONDecodeError:
+                ret = req.content if req.content else True
+            etag = req.headers.get("ETag")
+            if etag:
+                _ETAG_CACHE[self.url] = (etag, ret)
+            return ret
+        else:
+            raise RequestError(req)
+
+    def get_stream(self, chunk_size: int = 1024 * 1024):
+        """Stream content in chunks
+
+        A chunked alternative to `get_content` for very large payloads
+        (support files, revision exports, usage blobs) so the whole body
+        is never buffered in memory at once.
+
+        Keyword Arguments:
+            chunk_size (int): bytes per chunk. default 1MB
+
+        Returns:
+            iterator of bytes chunks
+        """
+        log.info(f"GET: {self.url}")
+
+        req = self.session.get(self.url, verify=self.verify, stream=True)
+        if req.ok:
+            return req.iter_content(chunk_size=chunk_size)
+        else:
+            raise RequestError(req)
+
     def post_cpl_auth(self, data=None):
         """Authorize to the Control Panel and get Cookie Jar"""
         log.info(f"POST: {self.url}")
@@ -5,7 +5,6 @@ from typing import Union, Any
 
 from firemon_api.core.app import App
 from firemon_api.core.query import Request
-from firemon_api.core.utils import Hashabledict
 
 
 log = logging.getLogger(__name__)
@@ -18,6 +17,7 @@ class JsonField(object):
     Basically anything that does not have an `id`
     """
 
+    __slots__ = ()
     _json_field = True
 
 
@@ -59,10 +59,10 @@ class BaseRecord(object):
             self._domain_url = app._domain_url
 
         self._ep_url = None
-        if self.__class__._is_domain_url and self.__class__._ep_name:
-            self._ep_url = f"{self._domain_url}/{self.__class__._ep_name}"
-        elif self.__class__._ep_name:
-            self._ep_url = f"{self._app_url}/{self.__class__._ep_name}"
+        if self._is_domain_url and self._ep_name:
+            self._ep_url = f"{self._domain_url}/{self._ep_name}"
+        elif self._ep_name:
+            self._ep_url = f"{self._app_url}/{self._ep_name}"
 
         if config:
             self._parse_config(config)
@@ -130,31 +130,38 @@ class BaseRecord(object):
         self._init_cache.append((key, get_return(value)))
 
     def _parse_config(self, config: Union[list, dict]) -> None:
+        # This loop runs for every key of every record loaded, so bind
+        # the hot lookups to locals once up front.
+        default_ret = self._default_ret
+        app = self._app
+        cls = self.__class__
+        add_cache = self._add_cache
+
         def list_parser(list_item):
             if isinstance(list_item, dict):
                 # Only attempt creating `Record` if there is an id.
-                if "id" in list_item.keys():
-                    return self._default_ret(list_item, self._app)
+                if "id" in list_item:
+                    return default_ret(list_item, app)
             return list_item
 
         for k, v in config.items():
             if isinstance(v, dict):
-                lookup = getattr(self.__class__, k, None)
+                lookup = getattr(cls, k, None)
                 if hasattr(lookup, "_json_field"):
-                    self._add_cache((k, v.copy()))
+                    add_cache((k, v.copy()))
                     setattr(self, k, v)
                     continue
                 if lookup:
-                    v = lookup(v, self._app)
+                    v = lookup(v, app)
                 else:
-                    v = self._default_ret(v, self._app)
-                self._add_cache((k, v))
+                    v = default_ret(v, app)
+                add_cache((k, v))
             elif isinstance(v, list):
                 v = [list_parser(i) for i in v]
                 to_cache = list(v)
-                self._add_cache((k, to_cache))
+                add_cache((k, to_cache))
             else:
-                self._add_cache((k, v))
+                add_cache((k, v))
             setattr(self, k, v)
 
     def _compare(self) -> bool:
@@ -170,18 +177,15 @@ class BaseRecord(object):
         return False
 
     def _diff(self) -> set:
-        def fmt_dict(k, v):
-            if isinstance(v, dict):
-                return k, Hashabledict(v)
-            if isinstance(v, list):
-                return k, ",".join(map(str, v))
-            return k, v
-
-        current = Hashabledict({fmt_dict(k, v) for k, v in self.serialize().items()})
-        init = Hashabledict(
-            {fmt_dict(k, v) for k, v in self.serialize(init=True).items()}
-        )
-        return set([i[0] for i in set(current.items()) ^ set(init.items())])
+        # Compare the serialized views directly. The old implementation
+        # rebuilt both sides as hashable sets (stringifying lists along
+        # the way) just to take a symmetric difference; plain equality
+        # per key gives the same answer without the throwaway copies.
+        current = self.serialize()
+        init = self.serialize(init=True)
+        return {
+            k for k in current.keys() | init.keys() if current.get(k) != init.get(k)
+        }
 
     def serialize(self, nested=False, init=False) -> dict:
         """Serializes an object
@@ -243,14 +247,16 @@ class Record(BaseRecord):
         ...}
     """
 
+    # Keys for a Record that might break if trying to `save` or
+    # `update`. A shared class-level frozenset; child classes override
+    # with their own rather than rebuilding a list per instance.
+    _no_no_keys: frozenset = frozenset()
+
     def __init__(self, config: dict, app: App):
         super().__init__(config, app)
 
-        self._no_no_keys = []
-
     def _clean_no_no(self, d: dict) -> dict:
-        # remove no_no_keys from a dict. A list of keys for a Record
-        # that might break if trying to `save` or `update`
+        # remove no_no_keys from a dict
         for k in self._no_no_keys:
             try:
                 d.pop(k)
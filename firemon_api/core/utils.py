@@ -44,6 +44,8 @@ def _build_dict(seq: list, key: str) -> dict:
 
 
 class Hashabledict(dict):
+    __slots__ = ()
+
     def __hash__(self):
         return hash(frozenset(self))
 